@@ -48,6 +48,37 @@ async def test_create_from_instance(engine):
     return u
 
 
+async def test_create_many(engine):
+    nickname = "test_create_many_{}".format(random.random())
+    users = await User.create_many(
+        [dict(nickname=nickname + "1", age=42), dict(nickname=nickname + "2")],
+        bind=engine,
+        timeout=10,
+    )
+    assert [u.nickname for u in users] == [nickname + "1", nickname + "2"]
+    assert len({u.id for u in users}) == 2
+    assert [u.age for u in users] == [42, 18]
+    for u in users:
+        u2 = await User.get(u.id, bind=engine)
+        assert u2.to_dict() == u.to_dict()
+
+    assert await User.create_many([], bind=engine) == []
+
+
+async def test_create_many_atomic(engine):
+    nickname = "test_create_many_atomic_{}".format(random.random())
+    u = await User.create(bind=engine, nickname=nickname)
+    with pytest.raises(Exception, match="Duplicate entry"):
+        await User.create_many(
+            [dict(nickname=nickname + "1"), dict(id=u.id, nickname=nickname + "2")],
+            bind=engine,
+        )
+    count = await engine.scalar(
+        db.select([db.func.count()]).where(User.nickname.startswith(nickname))
+    )
+    assert count == 1
+
+
 async def test_get(engine):
     u1 = await test_create(engine)
     u2 = await User.get(u1.id, bind=engine, timeout=10)
@@ -200,6 +231,14 @@ async def test_update_missing(engine, random_name):
         await rq.apply(bind=engine, timeout=10)
 
 
+async def test_update_nothing(engine, mocker):
+    u1 = await test_create(engine)
+    acquire = mocker.spy(engine, "acquire")
+    rq = u1.update()
+    assert await rq.apply(bind=engine) is rq
+    acquire.assert_not_called()
+
+
 async def test_update_multiple_primary_key(engine):
     u1 = await test_create(engine)
     u2 = await test_create(engine)
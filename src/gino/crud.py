@@ -1,5 +1,5 @@
+import functools
 import inspect
-import itertools
 import weakref
 
 import sqlalchemy as sa
@@ -7,13 +7,22 @@ from sqlalchemy.sql import ClauseElement
 
 from . import json_support
 from .declarative import Model, InvertDict
-from .engine import GinoConnection
+from .engine import GinoConnection, _cache_compiled
 from .exceptions import NoSuchRowError
 from .loader import AliasLoader, ModelLoader
 
 DEFAULT = object()
 
 
+@functools.lru_cache(None)
+def _json_types():
+    # imported lazily so that importing gino.crud does not load the drivers
+    from .dialects.asyncpg import JSONB
+    from .dialects.aiomysql import JSON
+
+    return JSONB, JSON
+
+
 class _Create:
     def __get__(self, instance, owner):
         if instance is None:
@@ -24,23 +33,40 @@ class _Create:
             return instance._create
 
 
+# The descriptors below build the clauses only once per model class, and hand out
+# shallow copies of them so that mutations like the memoized ``bind`` of ``Select``
+# don't leak into the cached ones.
+
+
 class _Query:
     def __get__(self, instance, owner):
         # noinspection PyProtectedMember
-        owner._check_abstract()
-        q = sa.select([owner.__table__])
+        q = owner._cached_clause(
+            "query",
+            lambda: sa.select([owner.__table__]).execution_options(
+                model=weakref.ref(owner)
+            ),
+        )
         if instance is not None:
-            q = q.where(instance.lookup())
-        return q.execution_options(model=weakref.ref(owner))
+            return q.where(instance.lookup())
+        # noinspection PyProtectedMember
+        return q._generate()
 
 
 class _Select:
     def __get__(self, instance, owner):
         def select(*args):
-            q = sa.select([getattr(owner, x) for x in args])
+            # noinspection PyProtectedMember
+            q = owner._cached_clause(
+                ("select",) + args,
+                lambda: sa.select([getattr(owner, x) for x in args]).execution_options(
+                    model=weakref.ref(owner), return_model=False
+                ),
+            )
             if instance is not None:
-                q = q.where(instance.lookup())
-            return q.execution_options(model=weakref.ref(owner), return_model=False)
+                return q.where(instance.lookup())
+            # noinspection PyProtectedMember
+            return q._generate()
 
         return select
 
@@ -49,9 +75,14 @@ class _Update:
     def __get__(self, instance, owner):
         if instance is None:
             # noinspection PyProtectedMember
-            owner._check_abstract()
-            q = owner.__table__.update()
-            return q.execution_options(model=weakref.ref(owner))
+            q = owner._cached_clause(
+                "update",
+                lambda: owner.__table__.update().execution_options(
+                    model=weakref.ref(owner)
+                ),
+            )
+            # noinspection PyProtectedMember
+            return q._generate()
         else:
             # noinspection PyProtectedMember
             return instance._update
@@ -61,9 +92,14 @@ class _Delete:
     def __get__(self, instance, owner):
         if instance is None:
             # noinspection PyProtectedMember
-            owner._check_abstract()
-            q = owner.__table__.delete()
-            return q.execution_options(model=weakref.ref(owner))
+            q = owner._cached_clause(
+                "delete",
+                lambda: owner.__table__.delete().execution_options(
+                    model=weakref.ref(owner)
+                ),
+            )
+            # noinspection PyProtectedMember
+            return q._generate()
         else:
             # noinspection PyProtectedMember
             return instance._delete
@@ -81,18 +117,33 @@ class UpdateRequest:
 
     """
 
+    __slots__ = (
+        "_instance",
+        "_values",
+        "_props",
+        "_literal",
+        "_locator",
+        "_locator_params",
+    )
+
     def __init__(self, instance: "CRUDModel"):
         self._instance = instance
         self._values = {}
         self._props = {}
         self._literal = True
         self._locator = None
+        self._locator_params = None
         if instance.__table__ is not None:
             try:
                 self._locator = instance.lookup()
             except LookupError:
                 # apply() will fail anyway, but still allow update()
                 pass
+            else:
+                # the primary key values are taken before update() changes them
+                if type(instance).lookup is CRUDModel.lookup:
+                    # noinspection PyProtectedMember
+                    self._locator_params = instance._pk_params()
 
     def _set(self, key, value):
         self._values[key] = value
@@ -122,37 +173,107 @@ class UpdateRequest:
                     self._instance.__class__.__name__
                 )
             )
+        if not self._values and not self._props:
+            # nothing to update, save the round-trip
+            return self
         cls = type(self._instance)
-        values = self._values.copy()
+        values = self._values
+
+        # handle JSON columns, without touching the pending values
+        if self._props:
+            values = values.copy()
+            self._apply_props(cls, values)
+
+        opts = dict(return_model=False)
+        sa_values = self._instance._get_sa_values(values)
+        # noinspection PyProtectedMember
+        columns = cls._attr_columns()
+        if (
+            self._locator_params is not None
+            and timeout is DEFAULT
+            and not any(isinstance(v, ClauseElement) for v in sa_values.values())
+        ):
+            # reuse the compiled UPDATE for the same set of columns, the new values
+            # and the primary key are bound as parameters
+            if bind is None:
+                bind = cls.__metadata__.bind
+            # noinspection PyProtectedMember
+            returning = bind._dialect.support_returning
+            keys = tuple(values)
+
+            def _update():
+                # noinspection PyProtectedMember
+                rv = cls.update.where(cls._pk_clause()).execution_options(**opts)
+                if returning:
+                    rv = rv.returning(*(columns[key] for key in keys))
+                return rv
+
+            # noinspection PyProtectedMember
+            clause = cls._cached_clause(
+                ("update_pk", keys, returning), _update, compiled=True
+            )
+            sa_values.update(self._locator_params)
+            await _query_and_update(bind, self._instance, clause, None, opts, sa_values)
+        else:
+            if timeout is not DEFAULT:
+                opts["timeout"] = timeout
+            clause = (
+                cls.update.where(
+                    self._locator,
+                )
+                .values(
+                    **sa_values,
+                )
+                .execution_options(**opts)
+            )
+            await _query_and_update(
+                bind,
+                self._instance,
+                clause,
+                [columns[key] for key in values],
+                opts,
+            )
+        for prop in self._props:
+            prop.reload(self._instance)
+        return self
 
-        # handle JSON columns
+    def _apply_props(self, cls, values):
+        psql_JSONB, mysql_JSON = _json_types()
+        # literal updates are collected as dicts, the others as flat lists of
+        # key-value arguments for the SQL JSON object builder functions
+        literal = self._literal
         json_updates = {}
         for prop, value in self._props.items():
             value = prop.save(self._instance, value)
-            updates = json_updates.setdefault(prop.prop_name, {})
-            if self._literal:
+            updates = json_updates.get(prop.prop_name)
+            if updates is None:
+                updates = json_updates[prop.prop_name] = {} if literal else []
+            if literal:
                 updates[prop.name] = value
             else:
                 if isinstance(value, int):
                     value = sa.cast(value, sa.BigInteger)
                 elif not isinstance(value, ClauseElement):
                     value = sa.cast(value, sa.Unicode)
-                updates[sa.cast(prop.name, sa.Unicode)] = value
+                # noinspection PyProtectedMember
+                updates.append(prop._name_clause)
+                updates.append(value)
+        # noinspection PyProtectedMember
+        columns = cls._attr_columns()
         for prop_name, updates in json_updates.items():
-            prop = getattr(cls, prop_name)
-            from .dialects.asyncpg import JSONB as psql_JSONB
-            from .dialects.aiomysql import JSON as mysql_JSON
-
+            prop = columns[prop_name]
             if isinstance(prop.type, psql_JSONB):
-                if self._literal:
+                if literal:
                     values[prop_name] = prop.concat(updates)
                 else:
                     values[prop_name] = prop.concat(
-                        sa.func.jsonb_build_object(*itertools.chain(*updates.items()))
+                        sa.func.jsonb_build_object(*updates)
                     )
             elif isinstance(prop.type, mysql_JSON):
+                if literal:
+                    updates = [arg for item in updates.items() for arg in item]
                 values[prop_name] = sa.func.json_merge_patch(
-                    prop, sa.func.json_object(*itertools.chain(*updates.items()))
+                    prop, sa.func.json_object(*updates)
                 )
             else:
                 raise TypeError(
@@ -161,26 +282,6 @@ class UpdateRequest:
                     "JSONB.".format(prop.type)
                 )
 
-        opts = dict(return_model=False)
-        if timeout is not DEFAULT:
-            opts["timeout"] = timeout
-        clause = (
-            type(self._instance)
-            .update.where(
-                self._locator,
-            )
-            .values(
-                **self._instance._get_sa_values(values),
-            )
-            .execution_options(**opts)
-        )
-        await _query_and_update(
-            bind, self._instance, clause, [getattr(cls, key) for key in values], opts
-        )
-        for prop in self._props:
-            prop.reload(self._instance)
-        return self
-
     def update(self, **values):
         """
         Set given attributes on the bound model instance, and add them into
@@ -214,10 +315,11 @@ class UpdateRequest:
 
         """
 
-        cls = type(self._instance)
+        # noinspection PyProtectedMember
+        json_props = type(self._instance)._json_props()
         for key, value in values.items():
-            prop = cls.__dict__.get(key)
-            if isinstance(prop, json_support.JSONProperty):
+            prop = json_props.get(key)
+            if prop is not None:
                 value_from = "__profile__"
                 method = self._set_prop
                 k = prop
@@ -431,54 +533,264 @@ class CRUDModel(Model):
 
     _update_request_cls = UpdateRequest
     _column_name_map = InvertDict()
+    __pk_cols__ = ()
+    __pk_names__ = ()
 
     def __init__(self, **values):
         super().__init__()
         self.__profile__ = None
-        self._update_request_cls(self).update(**values)
+        # skipped for empty instances created by loaders for every loaded row
+        if values:
+            names = self._column_name_map
+            if self._update_request_cls is UpdateRequest and all(
+                key in names for key in values
+            ):
+                # fast path for plain columns, same as what update() does in memory
+                for key, value in values.items():
+                    if not isinstance(value, ClauseElement):
+                        setattr(self, key, value)
+            else:
+                self._update_request_cls(self).update(**values)
 
     @classmethod
     def _init_table(cls, sub_cls):
         rv = Model._init_table(sub_cls)
         if rv is not None:
             rv.__model__ = weakref.ref(sub_cls)
+            sub_cls.__pk_cols__ = tuple(rv.primary_key.columns)
+            sub_cls.__pk_names__ = tuple(
+                sub_cls._column_name_map.invert_get(c.name) for c in sub_cls.__pk_cols__
+            )
         return rv
 
     @classmethod
     async def _create_without_instance(cls, bind=None, timeout=DEFAULT, **values):
         return await cls(**values)._create(bind=bind, timeout=timeout)
 
-    async def _create(self, bind=None, timeout=DEFAULT):
-        # handle JSON properties
-        cls = type(self)
+    @classmethod
+    async def create_many(cls, rows, bind=None, timeout=DEFAULT):
+        """
+        Create several new model instances and insert them into database.
+
+        This is the bulk version of :meth:`create` on model classes. Instead of
+        issuing one ``INSERT`` per row like calling :meth:`create` in a loop,
+        rows with the same set of attributes are inserted together in one
+        multi-row ``INSERT ... VALUES (...), (...) RETURNING ...`` statement,
+        saving the network round-trips::
+
+            users = await User.create_many([dict(name='fantix'), dict(name='gino')])
+
+        For databases that don't support ``RETURNING`` (MySQL), the rows are
+        still created one by one, but on the same connection.
+
+        All the statements run in one transaction (a savepoint if ``bind`` is
+        a connection already in a transaction), so either all rows are created
+        or none of them is.
+
+        .. note::
+
+            The returned rows are assigned to the instances by position. This
+            relies on PostgreSQL returning the rows of a multi-row ``INSERT ...
+            VALUES`` in the order of the ``VALUES`` list, which it does in
+            practice but doesn't guarantee in the documentation.
+
+        .. note::
+
+            Rows are grouped by the attributes they set, and each group is
+            inserted separately. The returned list is in the given order, but
+            the rows may be inserted in a different one when they set different
+            attributes, so generated values like serial primary keys don't
+            necessarily follow the order of ``rows``.
+
+        .. note::
+
+            The number of parameters in one statement is limited by the
+            database (32767 for PostgreSQL), split very large batches up.
+
+        :param rows: An iterable of :class:`dict`, each is the keyword
+          arguments for :meth:`create` of one instance.
+
+        :param bind: A :class:`~gino.engine.GinoEngine` to execute the
+          ``INSERT`` statements with, or ``None`` (default) to use the bound
+          engine on the metadata (:class:`~gino.api.Gino`).
+
+        :param timeout: Seconds to wait for the database to finish executing
+          each statement, ``None`` for wait forever. By default it will use the
+          ``timeout`` execution option value if unspecified.
+
+        :return: A :class:`list` of the created instances in the given order.
+
+        .. versionadded:: 1.1
+
+        """
         # noinspection PyUnresolvedReferences,PyProtectedMember
         cls._check_abstract()
-        profile_keys = set(self.__profile__.keys() if self.__profile__ else [])
-        for key in profile_keys:
-            cls.__dict__.get(key).save(self)
-        # initialize default values
-        for key, prop in cls.__dict__.items():
-            if key in profile_keys:
-                continue
-            if isinstance(prop, json_support.JSONProperty):
-                if prop.default is None or prop.after_get.method is not None:
-                    continue
-                setattr(self, key, getattr(self, key))
-                prop.save(self)
+        instances = [cls(**values) for values in rows]
+        if not instances:
+            return instances
+        if bind is None:
+            bind = cls.__metadata__.bind
+        if isinstance(bind, GinoConnection):
+            async with bind.transaction():
+                await cls._create_many(bind, instances, timeout)
+        else:
+            async with bind.transaction() as tx:
+                await cls._create_many(tx.connection, instances, timeout)
+        return instances
+
+    @classmethod
+    async def _create_many(cls, conn, instances, timeout):
+        # noinspection PyProtectedMember
+        if not conn._dialect.support_returning:
+            for instance in instances:
+                await instance._create(bind=conn, timeout=timeout)
+            return
+
+        # group rows by their columns, each group is inserted in one statement
+        groups = {}
+        for instance in instances:
+            instance._save_json_props()
+            values = instance._get_sa_values(instance.__values__)
+            groups.setdefault(tuple(values), []).append((instance, values))
 
-        # insert into database
         opts = dict(return_model=False, model=cls)
         if timeout is not DEFAULT:
             opts["timeout"] = timeout
-        q = (
-            cls.__table__.insert()
-            .values(**self._get_sa_values(self.__values__))
-            .execution_options(**opts)
-        )
-        await _query_and_update(bind, self, q, list(iter(cls)), opts)
+        for keys, group in groups.items():
+            if not keys or len(group) == 1:
+                for instance, _ in group:
+                    # noinspection PyProtectedMember
+                    await instance._insert(conn, timeout)
+                continue
+            q = (
+                cls.__table__.insert()
+                .values([values for _, values in group])
+                .returning(*cls)
+                .execution_options(**opts)
+            )
+            rows = await conn.all(q)
+            if len(rows) != len(group):
+                raise NoSuchRowError()
+            invert_get = cls._column_name_map.invert_get
+            for (instance, _), row in zip(group, rows):
+                values = instance.__values__
+                for k, v in row.items():
+                    values[invert_get(k)] = v
+                instance.__profile__ = None
+
+    def _save_json_props(self):
+        cls = type(self)
+        json_props = cls._json_props()
+        if not json_props:
+            return
+        profile = self.__profile__ or {}
+        for key in profile:
+            json_props[key].save(self)
+        # initialize default values
+        for key, prop in cls.__json_default_props__:
+            if key in profile:
+                continue
+            setattr(self, key, getattr(self, key))
+            prop.save(self)
+
+    @classmethod
+    def _attr_columns(cls):
+        rv = cls.__dict__.get("__attr_columns__")
+        if rv is None:
+            # noinspection PyUnresolvedReferences
+            rv = cls.__attr_columns__ = {
+                key: getattr(cls, key) for key in cls._column_name_map
+            }
+        return rv
+
+    @classmethod
+    def _json_props(cls):
+        rv = cls.__dict__.get("__json_props__")
+        if rv is None:
+            rv = {
+                key: prop
+                for key, prop in cls.__dict__.items()
+                if isinstance(prop, json_support.JSONProperty)
+            }
+            cls.__json_default_props__ = tuple(
+                (key, prop)
+                for key, prop in rv.items()
+                if prop.default is not None and prop.after_get.method is None
+            )
+            cls.__json_props__ = rv
+        return rv
+
+    async def _create(self, bind=None, timeout=DEFAULT):
+        cls = type(self)
+        # noinspection PyUnresolvedReferences,PyProtectedMember
+        cls._check_abstract()
+        # handle JSON properties
+        self._save_json_props()
+        return await self._insert(bind, timeout)
+
+    async def _insert(self, bind, timeout):
+        # insert into database, JSON properties are expected to be saved already
+        cls = type(self)
+        if bind is None:
+            bind = cls.__metadata__.bind
+        values = self._get_sa_values(self.__values__)
+        opts = dict(return_model=False, model=cls)
+        if timeout is DEFAULT and not any(
+            isinstance(v, ClauseElement) for v in values.values()
+        ):
+            # noinspection PyProtectedMember
+            returning = bind._dialect.support_returning
+
+            def _insert():
+                rv = cls.__table__.insert().execution_options(**opts)
+                if returning:
+                    rv = rv.returning(*cls)
+                return rv
+
+            q = cls._cached_clause(("insert", returning), _insert, compiled=True)
+            await _query_and_update(bind, self, q, None, opts, values)
+        else:
+            if timeout is not DEFAULT:
+                opts["timeout"] = timeout
+            q = cls.__table__.insert().values(**values).execution_options(**opts)
+            await _query_and_update(bind, self, q, list(iter(cls)), opts)
         self.__profile__ = None
         return self
 
+    @classmethod
+    def _cached_clause(cls, key, factory, compiled=False):
+        # statement templates are cached on each concrete class separately, because
+        # they carry the model class as the execution option; set ``compiled`` for
+        # templates that are executed as they are to reuse their compiled SQL too
+        cache = cls.__dict__.get("__clause_cache__")
+        if cache is None:
+            cache = cls.__clause_cache__ = {}
+        rv = cache.get(key)
+        if rv is None:
+            # noinspection PyUnresolvedReferences,PyProtectedMember
+            cls._check_abstract()
+            rv = factory()
+            if compiled:
+                rv = _cache_compiled(rv)
+            cache[key] = rv
+        return rv
+
+    @classmethod
+    def _pk_clause(cls):
+        return sa.and_(
+            *(
+                c == sa.bindparam("_pk_{}".format(i))
+                for i, c in enumerate(cls.__pk_cols__)
+            )
+        )
+
+    def _pk_params(self):
+        # read through the attributes, which may be customized by __attr_factory__
+        return {
+            "_pk_{}".format(i): getattr(self, name)
+            for i, name in enumerate(self.__pk_names__)
+        }
+
     def _get_sa_values(self, instance_values: dict) -> dict:
         values = {}
         for k, v in instance_values.items():
@@ -512,28 +824,36 @@ class CRUDModel(Model):
         """
         # noinspection PyUnresolvedReferences,PyProtectedMember
         cls._check_abstract()
+        columns = cls.__pk_cols__
         if not isinstance(ident, (list, tuple, dict)):
-            ident_ = [ident]
+            # fast path for the most common scalar primary key
+            if len(columns) != 1:
+                raise ValueError(
+                    "Incorrect number of values as primary key: "
+                    "expected {}, got 1.".format(len(columns))
+                )
+            params = {"_pk_0": ident}
         else:
-            ident_ = ident
-        columns = cls.__table__.primary_key.columns
-        if len(ident_) != len(columns):
-            raise ValueError(
-                "Incorrect number of values as primary key: "
-                "expected {}, got {}.".format(len(columns), len(ident_))
-            )
-        clause = cls.query
-        for i, c in enumerate(columns):
-            try:
-                val = ident_[i]
-            except KeyError:
-                val = ident_[cls._column_name_map.invert_get(c.name)]
-            clause = clause.where(c == val)
+            if len(ident) != len(columns):
+                raise ValueError(
+                    "Incorrect number of values as primary key: "
+                    "expected {}, got {}.".format(len(columns), len(ident))
+                )
+            params = {}
+            for i, c in enumerate(columns):
+                try:
+                    val = ident[i]
+                except KeyError:
+                    val = ident[cls.__pk_names__[i]]
+                params["_pk_{}".format(i)] = val
+        clause = cls._cached_clause(
+            "get_pk", lambda: cls.query.where(cls._pk_clause()), compiled=True
+        )
         if timeout is not DEFAULT:
             clause = clause.execution_options(timeout=timeout)
         if bind is None:
             bind = cls.__metadata__.bind
-        return await bind.first(clause)
+        return await bind.first(clause, params)
 
     def append_where_primary_key(self, q):
         """
@@ -571,11 +891,14 @@ class CRUDModel(Model):
         .. versionadded:: 0.7.6
 
         """
-        exps = []
-        for c in self.__table__.primary_key.columns:
-            exps.append(c == getattr(self, self._column_name_map.invert_get(c.name)))
-        if exps:
-            return sa.and_(*exps)
+        cls = type(self)
+        names = cls.__pk_names__
+        if len(names) == 1:
+            return cls.__pk_cols__[0] == getattr(self, names[0])
+        elif names:
+            return sa.and_(
+                *(c == getattr(self, name) for c, name in zip(cls.__pk_cols__, names))
+            )
         else:
             raise LookupError(
                 "Instance-level CRUD operations not allowed on "
@@ -590,11 +913,22 @@ class CRUDModel(Model):
         cls = type(self)
         # noinspection PyUnresolvedReferences,PyProtectedMember
         cls._check_abstract()
-        clause = cls.delete.where(self.lookup())
+        if cls.lookup is CRUDModel.lookup and cls.__pk_cols__:
+            clause = cls._cached_clause(
+                "delete_pk",
+                lambda: cls.delete.where(cls._pk_clause()),
+                compiled=True,
+            )
+            params = self._pk_params()
+        else:
+            clause = cls.delete.where(self.lookup())
+            params = None
         if timeout is not DEFAULT:
             clause = clause.execution_options(timeout=timeout)
         if bind is None:
             bind = self.__metadata__.bind
+        if params:
+            return (await bind.status(clause, params))[0]
         return (await bind.status(clause))[0]
 
     def to_dict(self):
@@ -611,14 +945,20 @@ class CRUDModel(Model):
             :mod:`.json_support`
 
         """
-        cls = type(self)
-        # noinspection PyTypeChecker
-        keys = set(cls._column_name_map.invert_get(c.name) for c in cls)
-        for key, prop in cls.__dict__.items():
-            if isinstance(prop, json_support.JSONProperty):
-                keys.add(key)
-                keys.discard(prop.prop_name)
-        return dict((k, getattr(self, k)) for k in keys)
+        return {k: getattr(self, k) for k in type(self)._dict_keys()}
+
+    @classmethod
+    def _dict_keys(cls):
+        rv = cls.__dict__.get("__dict_keys__")
+        if rv is None:
+            # noinspection PyTypeChecker
+            keys = [cls._column_name_map.invert_get(c.name) for c in cls]
+            for key, prop in cls._json_props().items():
+                keys.append(key)
+                if prop.prop_name in keys:
+                    keys.remove(prop.prop_name)
+            rv = cls.__dict_keys__ = tuple(keys)
+        return rv
 
     @classmethod
     def load(cls, *column_names, **relationships):
@@ -785,24 +1125,26 @@ class QueryModel(type):
         return self._model(*args, **kwargs)
 
 
-async def _query_and_update(bind, item, query, cols, execution_opts):
+async def _query_and_update(bind, item, query, cols, execution_opts, params=None):
     cls = type(item)
     if bind is None:
         bind = cls.__metadata__.bind
     # noinspection PyProtectedMember
-    if bind._dialect.support_returning:
+    returning = bind._dialect.support_returning
+    if returning and cols is not None:
         # noinspection PyArgumentList
         query = query.returning(*cols)
+    multiparams = (params,) if params else ()
 
     async def _execute_and_fetch(conn, query):
-        context, row = await conn._first_with_context(query)
+        context, row = await conn._first_with_context(query, *multiparams)
         # For DBMS like MySQL that doesn't support returning inserted or modified
         # rows, a workaround is applied to infer necessary data to query from the
         # database. This is not able to cover all cases, especially for those
         # statements that the end results are not exactly the same as in the queries.
         # One example is the DATETIME type in MySQL. By default, inserted date are
         # rounded to seconds. This is not visible to the engine.
-        if not bind._dialect.support_returning:
+        if not returning:
             if context.isinsert:
                 table = context.compiled.statement.table
                 key_getter = context.compiled._key_getters_for_crud_column[2]
@@ -860,8 +1202,10 @@ async def _query_and_update(bind, item, query, cols, execution_opts):
             row = await _execute_and_fetch(conn, query)
     if not row:
         raise NoSuchRowError()
+    values = item.__values__
+    invert_get = cls._column_name_map.invert_get
     for k, v in row.items():
-        item.__values__[item._column_name_map.invert_get(k)] = v
+        values[invert_get(k)] = v
 
 
 def _cast_json(column, value):
@@ -18,6 +18,8 @@ class ColumnAttribute:
     This utility is customizable by defining ``__attr_factory__`` in the model class.
     """
 
+    __slots__ = ("prop_name", "column")
+
     def __init__(self, prop_name, column):
         self.prop_name = prop_name
         self.column = column
@@ -61,6 +61,8 @@ class AiomysqlExecutionContext(base.ExecutionContextOverride, MySQLExecutionCont
 
 
 class AiomysqlIterator(base.Cursor):
+    __slots__ = ("_context", "_cursor", "_queried")
+
     def __init__(self, context, cursor):
         self._context = context
         self._cursor = cursor
@@ -113,6 +115,14 @@ class AiomysqlIterator(base.Cursor):
 
 
 class DBAPICursor(base.DBAPICursor):
+    __slots__ = (
+        "_conn",
+        "_cursor_description",
+        "_status",
+        "last_row_id",
+        "affected_rows",
+    )
+
     def __init__(self, dbapi_conn):
         self._conn = dbapi_conn
         self._cursor_description = None
@@ -120,10 +130,7 @@ class DBAPICursor(base.DBAPICursor):
         self.last_row_id = None
         self.affected_rows = 0
 
-    async def prepare(self, context, clause=None):
-        raise Exception("aiomysql doesn't support prepare")
-
-    async def async_execute(self, query, timeout, args, limit=0, many=False):
+    async def _acquire(self, timeout):
         if timeout is None:
             conn = await self._conn.acquire(timeout=timeout)
         else:
@@ -131,7 +138,13 @@ class DBAPICursor(base.DBAPICursor):
             conn = await self._conn.acquire(timeout=timeout)
             after = time.monotonic()
             timeout -= after - before
+        return conn, timeout
 
+    async def prepare(self, context, clause=None):
+        raise Exception("aiomysql doesn't support prepare")
+
+    async def async_execute(self, query, timeout, args, limit=0, many=False):
+        conn, timeout = await self._acquire(timeout)
         if not many:
             return await self._async_execute(conn, query, timeout, args)
 
@@ -309,11 +322,11 @@ class Transaction(base.Transaction):
         if self._set_isolation is not None:
             await self._set_isolation(self._conn)
 
-    async def commit(self):
-        await self._conn.commit()
+    def commit(self):
+        return self._conn.commit()
 
-    async def rollback(self):
-        await self._conn.rollback()
+    def rollback(self):
+        return self._conn.rollback()
 
 
 # MySQL doesn't need to create ENUM types like PostgreSQL, do nothing here
@@ -21,6 +21,7 @@ from sqlalchemy.dialects.postgresql.base import (
 from sqlalchemy.sql import sqltypes
 
 from . import base
+from ..engine import _cache_compiled
 
 try:
     import click
@@ -36,6 +37,71 @@ JSON_COLTYPE = 114
 JSONB_COLTYPE = 3802
 
 
+def _unicode_params(*names):
+    return [sql.bindparam(name, type_=sqltypes.Unicode) for name in names]
+
+
+# Statements used by the has_*() checks, built and compiled only once.
+_HAS_SCHEMA = _cache_compiled(
+    sql.text(
+        "select nspname from pg_namespace where lower(nspname)=:schema"
+    ).bindparams(*_unicode_params("schema"))
+)
+_HAS_TABLE = _cache_compiled(
+    sql.text(
+        "select relname from pg_class c join pg_namespace n on "
+        "n.oid=c.relnamespace where "
+        "pg_catalog.pg_table_is_visible(c.oid) "
+        "and relname=:name"
+    ).bindparams(*_unicode_params("name"))
+)
+_HAS_TABLE_IN_SCHEMA = _cache_compiled(
+    sql.text(
+        "select relname from pg_class c join pg_namespace n on "
+        "n.oid=c.relnamespace where n.nspname=:schema and "
+        "relname=:name"
+    ).bindparams(*_unicode_params("name", "schema"))
+)
+_HAS_SEQUENCE = _cache_compiled(
+    sql.text(
+        "SELECT relname FROM pg_class c join pg_namespace n on "
+        "n.oid=c.relnamespace where relkind='S' and "
+        "n.nspname=current_schema() "
+        "and relname=:name"
+    ).bindparams(*_unicode_params("name"))
+)
+_HAS_SEQUENCE_IN_SCHEMA = _cache_compiled(
+    sql.text(
+        "SELECT relname FROM pg_class c join pg_namespace n on "
+        "n.oid=c.relnamespace where relkind='S' and "
+        "n.nspname=:schema and relname=:name"
+    ).bindparams(*_unicode_params("name", "schema"))
+)
+_HAS_TYPE = _cache_compiled(
+    sql.text(
+        """
+        SELECT EXISTS (
+            SELECT * FROM pg_catalog.pg_type t
+            WHERE t.typname = :typname
+            AND pg_type_is_visible(t.oid)
+            )
+        """
+    ).bindparams(*_unicode_params("typname"))
+)
+_HAS_TYPE_IN_SCHEMA = _cache_compiled(
+    sql.text(
+        """
+        SELECT EXISTS (
+            SELECT * FROM pg_catalog.pg_type t, pg_catalog.pg_namespace n
+            WHERE t.typnamespace = n.oid
+            AND t.typname = :typname
+            AND n.nspname = :nspname
+            )
+        """
+    ).bindparams(*_unicode_params("typname", "nspname"))
+)
+
+
 class AsyncpgDBAPI(base.BaseDBAPI):
     Error = asyncpg.PostgresError, asyncpg.InterfaceError
 
@@ -84,6 +150,8 @@ class AsyncpgExecutionContext(base.ExecutionContextOverride, PGExecutionContext)
 
 
 class AsyncpgIterator:
+    __slots__ = ("_context", "_iterator")
+
     def __init__(self, context, iterator):
         self._context = context
         self._iterator = iterator
@@ -94,6 +162,8 @@ class AsyncpgIterator:
 
 
 class AsyncpgCursor(base.Cursor):
+    __slots__ = ("_context", "_cursor")
+
     def __init__(self, context, cursor):
         self._context = context
         self._cursor = cursor
@@ -119,6 +189,8 @@ class AsyncpgCursor(base.Cursor):
 
 
 class PreparedStatement(base.PreparedStatement):
+    __slots__ = ("_prepared",)
+
     def __init__(self, prepared, clause=None):
         super().__init__(clause)
         self._prepared = prepared
@@ -142,6 +214,8 @@ class PreparedStatement(base.PreparedStatement):
 
 
 class DBAPICursor(base.DBAPICursor):
+    __slots__ = ("_conn", "_attributes", "_status")
+
     def __init__(self, dbapi_conn):
         self._conn = dbapi_conn
         self._attributes = None
@@ -170,8 +244,10 @@ class DBAPICursor(base.DBAPICursor):
 
     async def async_execute(self, query, timeout, args, limit=0, many=False):
         conn, timeout = await self._acquire(timeout)
-        _protocol = getattr(conn, "_protocol")
-        timeout = getattr(_protocol, "_get_timeout")(timeout)
+        # noinspection PyProtectedMember
+        _protocol = conn._protocol
+        # noinspection PyProtectedMember
+        timeout = _protocol._get_timeout(timeout)
 
         def executor(state, timeout_):
             if many:
@@ -179,10 +255,13 @@ class DBAPICursor(base.DBAPICursor):
             else:
                 return _protocol.bind_execute(state, args, "", limit, True, timeout_)
 
-        with getattr(conn, "_stmt_exclusive_section"):
-            result, stmt = await getattr(conn, "_do_execute")(query, executor, timeout)
+        # noinspection PyProtectedMember
+        with conn._stmt_exclusive_section:
+            # noinspection PyProtectedMember
+            result, stmt = await conn._do_execute(query, executor, timeout)
             try:
-                self._attributes = getattr(stmt, "_get_attributes")()
+                # noinspection PyProtectedMember
+                self._attributes = stmt._get_attributes()
             except TypeError:  # asyncpg <= 0.12.0
                 self._attributes = []
             if not many:
@@ -401,14 +480,15 @@ class Transaction(base.Transaction):
     def raw_transaction(self):
         return self._tx
 
-    async def begin(self):
-        await self._tx.start()
+    # return the awaitables of asyncpg directly to save a coroutine frame per call
+    def begin(self):
+        return self._tx.start()
 
-    async def commit(self):
-        await self._tx.commit()
+    def commit(self):
+        return self._tx.commit()
 
-    async def rollback(self):
-        await self._tx.rollback()
+    def rollback(self):
+        return self._tx.rollback()
 
 
 class AsyncEnum(ENUM):
@@ -560,126 +640,41 @@ class AsyncpgDialect(PGDialect, base.AsyncDialectMixin):
         return val.upper()
 
     async def has_schema(self, connection, schema):
-        row = await connection.first(
-            sql.text(
-                "select nspname from pg_namespace " "where lower(nspname)=:schema"
-            ).bindparams(
-                sql.bindparam(
-                    "schema",
-                    util.text_type(schema.lower()),
-                    type_=sqltypes.Unicode,
-                )
-            )
-        )
-
+        row = await connection.first(_HAS_SCHEMA, schema=util.text_type(schema.lower()))
         return bool(row)
 
     async def has_table(self, connection, table_name, schema=None):
         # seems like case gets folded in pg_class...
         if schema is None:
-            row = await connection.first(
-                sql.text(
-                    "select relname from pg_class c join pg_namespace n on "
-                    "n.oid=c.relnamespace where "
-                    "pg_catalog.pg_table_is_visible(c.oid) "
-                    "and relname=:name"
-                ).bindparams(
-                    sql.bindparam(
-                        "name", util.text_type(table_name), type_=sqltypes.Unicode
-                    ),
-                )
-            )
+            row = await connection.first(_HAS_TABLE, name=util.text_type(table_name))
         else:
             row = await connection.first(
-                sql.text(
-                    "select relname from pg_class c join pg_namespace n on "
-                    "n.oid=c.relnamespace where n.nspname=:schema and "
-                    "relname=:name"
-                ).bindparams(
-                    sql.bindparam(
-                        "name",
-                        util.text_type(table_name),
-                        type_=sqltypes.Unicode,
-                    ),
-                    sql.bindparam(
-                        "schema",
-                        util.text_type(schema),
-                        type_=sqltypes.Unicode,
-                    ),
-                )
+                _HAS_TABLE_IN_SCHEMA,
+                name=util.text_type(table_name),
+                schema=util.text_type(schema),
             )
         return bool(row)
 
     async def has_sequence(self, connection, sequence_name, schema=None):
         if schema is None:
             row = await connection.first(
-                sql.text(
-                    "SELECT relname FROM pg_class c join pg_namespace n on "
-                    "n.oid=c.relnamespace where relkind='S' and "
-                    "n.nspname=current_schema() "
-                    "and relname=:name"
-                ).bindparams(
-                    sql.bindparam(
-                        "name",
-                        util.text_type(sequence_name),
-                        type_=sqltypes.Unicode,
-                    )
-                )
+                _HAS_SEQUENCE, name=util.text_type(sequence_name)
             )
         else:
             row = await connection.first(
-                sql.text(
-                    "SELECT relname FROM pg_class c join pg_namespace n on "
-                    "n.oid=c.relnamespace where relkind='S' and "
-                    "n.nspname=:schema and relname=:name"
-                ).bindparams(
-                    sql.bindparam(
-                        "name",
-                        util.text_type(sequence_name),
-                        type_=sqltypes.Unicode,
-                    ),
-                    sql.bindparam(
-                        "schema",
-                        util.text_type(schema),
-                        type_=sqltypes.Unicode,
-                    ),
-                )
+                _HAS_SEQUENCE_IN_SCHEMA,
+                name=util.text_type(sequence_name),
+                schema=util.text_type(schema),
             )
-
         return bool(row)
 
     async def has_type(self, connection, type_name, schema=None):
         if schema is not None:
-            query = """
-            SELECT EXISTS (
-                SELECT * FROM pg_catalog.pg_type t, pg_catalog.pg_namespace n
-                WHERE t.typnamespace = n.oid
-                AND t.typname = :typname
-                AND n.nspname = :nspname
-                )
-                """
-        else:
-            query = """
-            SELECT EXISTS (
-                SELECT * FROM pg_catalog.pg_type t
-                WHERE t.typname = :typname
-                AND pg_type_is_visible(t.oid)
-                )
-                """
-        query = sql.text(query)
-        query = query.bindparams(
-            sql.bindparam(
-                "typname",
-                util.text_type(type_name),
-                type_=sqltypes.Unicode,
-            ),
-        )
-        if schema is not None:
-            query = query.bindparams(
-                sql.bindparam(
-                    "nspname",
-                    util.text_type(schema),
-                    type_=sqltypes.Unicode,
-                ),
+            rv = await connection.scalar(
+                _HAS_TYPE_IN_SCHEMA,
+                typname=util.text_type(type_name),
+                nspname=util.text_type(schema),
             )
-        return bool(await connection.scalar(query))
+        else:
+            rv = await connection.scalar(_HAS_TYPE, typname=util.text_type(type_name))
+        return bool(rv)
@@ -11,6 +11,9 @@ from ..loader import Loader
 DEFAULT = object()
 
 
+COMPILED_CACHE_SIZE = 500
+
+
 class BaseDBAPI:
     paramstyle = "numeric"
     Error = Exception
@@ -22,6 +25,8 @@ class BaseDBAPI:
 
 
 class DBAPICursor:
+    __slots__ = ()
+
     def execute(self, statement, parameters):
         pass
 
@@ -79,6 +84,8 @@ class Transaction:
 
 
 class PreparedStatement:
+    __slots__ = ("context", "clause")
+
     def __init__(self, clause=None):
         self.context = None
         self.clause = clause
@@ -139,21 +146,25 @@ class PreparedStatement:
 
 
 class _PreparedIterableCursor:
+    __slots__ = ("_prepared", "_params", "_kwargs")
+
     def __init__(self, prepared, params, kwargs):
         self._prepared = prepared
         self._params = params
         self._kwargs = kwargs
 
     def __aiter__(self):
-        return getattr(self._prepared, "_get_iterator")(*self._params, **self._kwargs)
+        # noinspection PyProtectedMember
+        return self._prepared._get_iterator(*self._params, **self._kwargs)
 
     def __await__(self):
-        return getattr(self._prepared, "_get_cursor")(
-            *self._params, **self._kwargs
-        ).__await__()
+        # noinspection PyProtectedMember
+        return self._prepared._get_cursor(*self._params, **self._kwargs).__await__()
 
 
 class _IterableCursor:
+    __slots__ = ("_context",)
+
     def __init__(self, context):
         self._context = context
 
@@ -166,7 +177,15 @@ class _IterableCursor:
         return self._context.cursor.iterate(self._context)
 
     async def _get_cursor(self):
-        return await (await self._iterate())
+        # same as awaiting the result of _iterate(), minus the intermediate objects
+        context = self._context
+        if context.dialect.support_prepare:
+            prepared = await context.cursor.prepare(context)
+            # noinspection PyProtectedMember
+            return await prepared._get_cursor(
+                *context.parameters[0], timeout=context.timeout
+            )
+        return await context.cursor.iterate(context)
 
     def __aiter__(self):
         return _LazyIterator(self._iterate)
@@ -176,6 +195,8 @@ class _IterableCursor:
 
 
 class _LazyIterator:
+    __slots__ = ("_init", "_iter")
+
     def __init__(self, init):
         self._init = init
         self._iter = None
@@ -197,32 +218,40 @@ class _ResultProxy:
         return self._context
 
     async def execute(
-        self, one=False, return_model=True, status=False, return_context=False
+        self, one=False, return_model=True, status=False, return_context=False, limit=0
     ):
         context = self._context
-
-        param_groups = []
-        for params in context.parameters:
-            replace_params = []
-            for val in params:
-                if asyncio.iscoroutine(val):
-                    val = await val
-                replace_params.append(val)
-            param_groups.append(replace_params)
+        if one:
+            limit = 1
+        elif context.loader is not None:
+            # custom loaders may merge multiple rows into one object
+            limit = 0
 
         cursor = context.cursor
         if context.executemany:
+            param_groups = []
+            for params in context.parameters:
+                replace_params = []
+                for val in params:
+                    if asyncio.iscoroutine(val):
+                        val = await val
+                    replace_params.append(val)
+                param_groups.append(replace_params)
             return await cursor.async_execute(
                 context.statement, context.timeout, param_groups, many=True
             )
-        args = param_groups[0]
+
+        # single execution: only copy the parameters if some are to be awaited
+        args = context.parameters[0]
+        if any(asyncio.iscoroutine(val) for val in args):
+            args = [(await val) if asyncio.iscoroutine(val) else val for val in args]
         if context.baked_query:
             rows = await cursor.execute_baked(
                 context.baked_query, context.timeout, args, one
             )
         else:
             rows = await cursor.async_execute(
-                context.statement, context.timeout, args, 1 if one else 0
+                context.statement, context.timeout, args, limit
             )
         item = context.process_rows(rows, return_model=return_model)
         if one:
@@ -249,6 +278,8 @@ class _ResultProxy:
 
 
 class Cursor:
+    __slots__ = ()
+
     async def many(self, n, *, timeout=DEFAULT):
         raise NotImplementedError
 
@@ -293,22 +324,51 @@ class ExecutionContextOverride:
     def loader(self):
         return self._compiled_first_opt("loader", None)
 
+    # The result metadata and the loader are kept for all process_rows() calls of
+    # the same execution, which happen per row or per batch when iterating a cursor.
+    # The result proxy itself is not kept, because it refers back to this context.
+
+    @util.memoized_property
+    def _result_metadata(self):
+        # noinspection PyUnresolvedReferences
+        proxy = super().get_result_proxy()
+        if proxy._echo:
+            # rows are logged by the result proxy, build one per call
+            return None
+        return proxy._metadata, proxy._process_row
+
+    @util.memoized_property
+    def _row_loader(self):
+        loader = self.loader
+        if loader is None:
+            loader = self.model
+        if loader is not None:
+            loader = Loader.get(loader)
+        return loader
+
     def process_rows(self, rows, return_model=True):
         if not rows:
             return []
-        # noinspection PyUnresolvedReferences
-        rv = rows = super().get_result_proxy().process_rows(rows)
-        loader = self.loader
-        if loader is None and self.model is not None:
-            loader = Loader.get(self.model)
+        result_metadata = self._result_metadata
+        if result_metadata is None:
+            # noinspection PyUnresolvedReferences
+            rows = super().get_result_proxy().process_rows(rows)
+        else:
+            metadata, process_row = result_metadata
+            keymap = metadata._keymap
+            processors = metadata._processors
+            rows = [process_row(metadata, row, processors, keymap) for row in rows]
+        rv = rows
+        loader = self._row_loader
         if loader is not None and return_model and self.return_model:
             ctx = {}
             rv = []
-            loader = Loader.get(loader)
+            do_load = loader.do_load
+            append = rv.append
             for row in rows:
-                obj, distinct = loader.do_load(row, ctx)
+                obj, distinct = do_load(row, ctx)
                 if distinct:
-                    rv.append(obj)
+                    append(obj)
         return rv
 
     def get_result_proxy(self):
@@ -427,6 +487,8 @@ class AsyncDialectMixin:
     _bakery = None
 
     def _init_mixin(self, bakery):
+        # compiled SQL of the statement templates registered with _cache_compiled()
+        self._compiled_cache = util.LRUCache(COMPILED_CACHE_SIZE)
         self._sa_conn = _SAConnection(
             _SAEngine(self), _DBAPIConnection(self.cursor_cls)
         )
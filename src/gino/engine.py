@@ -3,6 +3,7 @@ import collections
 import functools
 import sys
 import time
+import weakref
 from contextvars import ContextVar
 
 from sqlalchemy.cutils import _distill_params
@@ -37,6 +38,11 @@ class _BaseDBAPIConnection:
     async def acquire(self, *, timeout=None):
         if self._closed:
             raise ValueError("This connection is already released permanently.")
+        # fast path: the raw connection is already checked out from the pool, skip
+        # the lock and the walk up to the root connection for reusing ones
+        conn = self.raw_connection
+        if conn is not None:
+            return conn
         return await self._acquire(timeout)
 
     async def _acquire(self, timeout):
@@ -109,9 +115,29 @@ class _bypass_no_param:
 
 _bypass_no_param = _bypass_no_param()
 
+_cached_elems = weakref.WeakSet()
+
+
+def _cache_compiled(elem):
+    # Executing the very same elem again skips the SQLAlchemy compilation, only the
+    # parameters are bound per execution. Meant for long-living statement templates
+    # with bindparam() placeholders, derived clauses (e.g. `.where()`) are not cached.
+    # The compiled SQL is kept in a bounded cache on the dialect (see
+    # AsyncDialectMixin), so it goes away together with the engine.
+    _cached_elems.add(elem)
+    return elem
+
 
 # noinspection PyAbstractClass
 class _SAConnection(Connection):
+    def _execute_clauseelement(self, elem, multiparams, params):
+        if elem in _cached_elems and "compiled_cache" not in self._execution_options:
+            return super(
+                _SAConnection,
+                self.execution_options(compiled_cache=self.dialect._compiled_cache),
+            )._execute_clauseelement(elem, multiparams, params)
+        return super()._execute_clauseelement(elem, multiparams, params)
+
     def _execute_context(self, dialect, constructor, statement, parameters, *args):
         if parameters == [_bypass_no_param]:
             constructor = getattr(
@@ -364,7 +390,8 @@ class GinoConnection:
 
         """
         result = self._execute(clause, multiparams, params)
-        ret = await result.execute()
+        # two rows are enough to tell if there are multiple results
+        ret = await result.execute(limit=2)
 
         if ret is None or len(ret) == 0:
             return None
@@ -103,6 +103,11 @@ class JSONProperty:
     def make_expression(self, base_exp):
         return base_exp
 
+    @sa.util.memoized_property
+    def _name_clause(self):
+        # the key in JSON building SQL functions, built once and shared by updates
+        return sa.cast(self.name, sa.Unicode)
+
     def decode(self, val):
         return val
 
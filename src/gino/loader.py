@@ -124,6 +124,7 @@ class Loader:
 
 _none = object()
 _none_as_none = object()
+_row_columns = object()
 
 
 def _get_column(model, column_or_name) -> Column:
@@ -228,22 +229,31 @@ class ModelLoader(Loader):
             self.model._column_name_map.invert_get(c.name): c for c in self.columns
         }
 
-    def _do_load(self, row, none_as_none):
+    def _get_row_columns(self, row, context):
+        # all rows of one query share the same columns, look them up only once
+        key = (_row_columns, self)
+        rv = context.get(key)
+        if rv is None:
+            rv = context[key] = tuple(
+                (prop_name, column)
+                for prop_name, column in self._prop_column_map.items()
+                if column in row
+            )
+        return rv
+
+    def _do_load(self, row, none_as_none, columns=None):
         # none_as_none indicates that in the case of every column of the object is
         # None, whether a None or empty instance of the model should be returned.
-        all_is_none = none_as_none
-
-        values = {}
-
-        for prop_name, column in self._prop_column_map.items():
-            if column in row:
-                row_value = row[column]
-
-                values[prop_name] = row_value
-                all_is_none &= row_value is None
-
-        if all_is_none:
-            return None
+        if columns is None:
+            columns = self._get_row_columns(row, {})
+        values = {prop_name: row[column] for prop_name, column in columns}
+
+        if none_as_none:
+            for value in values.values():
+                if value is not None:
+                    break
+            else:
+                return None
 
         rv = self.model()
         # no need to update, model just created
@@ -268,12 +278,20 @@ class ModelLoader(Loader):
             key = tuple(row[col] for col in self._distinct)
             rv = ctx.get(key, _none)
             if rv is _none:
-                rv = self._do_load(row, context.get(_none_as_none, False))
+                rv = self._do_load(
+                    row,
+                    context.get(_none_as_none, False),
+                    self._get_row_columns(row, context),
+                )
                 ctx[key] = rv
             else:
                 distinct = False
         else:
-            rv = self._do_load(row, context.get(_none_as_none, False))
+            rv = self._do_load(
+                row,
+                context.get(_none_as_none, False),
+                self._get_row_columns(row, context),
+            )
 
         if rv is None:
             return None, None
@@ -67,6 +67,8 @@ class GinoTransaction:
 
     """
 
+    __slots__ = ("_conn", "_args", "_kwargs", "_tx", "_managed")
+
     def __init__(self, conn, args, kwargs):
         self._conn = conn
         self._args = args
@@ -1,7 +1,12 @@
+import gc
 import random
+import weakref
 
 import pytest
+from sqlalchemy.sql import ClauseElement
 
+import gino
+from gino.declarative import ColumnAttribute
 from .models import db, User, UserType, Friendship, Relation, PG_URL
 
 pytestmark = pytest.mark.asyncio
@@ -48,6 +53,73 @@ async def test_create_from_instance(engine):
     return u
 
 
+async def test_create_many(engine, mocker):
+    nickname = "test_create_many_{}".format(random.random())
+    users = await User.create_many(
+        [
+            dict(nickname=nickname + "1", age=42),
+            dict(nickname=nickname + "2", age=24),
+            dict(nickname=nickname + "3", type=UserType.USER),
+        ],
+        bind=engine,
+        timeout=10,
+    )
+    assert [u.nickname for u in users] == [nickname + str(i) for i in range(1, 4)]
+    assert len({u.id for u in users}) == 3
+    assert [u.age for u in users] == [42, 24, 18]
+    for u in users:
+        u2 = await User.get(u.id, bind=engine)
+        assert u2.to_dict() == u.to_dict()
+
+    assert await User.create_many([], bind=engine) == []
+
+    # JSON properties are saved once per row, also for rows inserted alone
+    save = mocker.spy(User, "_save_json_props")
+    await User.create_many(
+        [dict(nickname=nickname), dict(nickname=nickname, age=1), dict()],
+        bind=engine,
+    )
+    assert save.call_count == 3
+    mocker.stop(save)
+
+    # returned rows are matched to the instances in order
+    rows = [dict(nickname=nickname + str(i), age=i) for i in range(50)]
+    random.shuffle(rows)
+    users = await User.create_many(rows, bind=engine)
+    assert [dict(nickname=u.nickname, age=u.age) for u in users] == rows
+    for u in users:
+        u2 = await User.get(u.id, bind=engine)
+        assert (u2.nickname, u2.age) == (u.nickname, u.age)
+
+
+async def test_create_many_atomic(engine):
+    nickname = "test_create_many_atomic_{}".format(random.random())
+    u = await User.create(bind=engine, nickname=nickname)
+    with pytest.raises(Exception, match="duplicate key"):
+        await User.create_many(
+            [
+                dict(nickname=nickname + "1"),
+                dict(nickname=nickname + "2"),
+                dict(id=u.id, nickname=nickname + "3"),
+                dict(id=u.id + 100000, nickname=nickname + "4"),
+            ],
+            bind=engine,
+        )
+    count = await engine.scalar(
+        db.select([db.func.count()]).where(User.nickname.startswith(nickname))
+    )
+    assert count == 1
+
+    # in an outer transaction, only the savepoint is rolled back
+    async with engine.transaction() as tx:
+        with pytest.raises(Exception, match="duplicate key"):
+            await User.create_many(
+                [dict(nickname=nickname + "5"), dict(id=u.id, nickname=nickname)],
+                bind=tx.connection,
+            )
+        assert await User.get(u.id, bind=tx.connection)
+
+
 async def test_get(engine):
     u1 = await test_create(engine)
     u2 = await User.get(u1.id, bind=engine, timeout=10)
@@ -198,6 +270,14 @@ async def test_update_missing(engine, random_name):
         await rq.apply(bind=engine, timeout=10)
 
 
+async def test_update_nothing(engine, mocker):
+    u1 = await test_create(engine)
+    acquire = mocker.spy(engine, "acquire")
+    rq = u1.update()
+    assert await rq.apply(bind=engine) is rq
+    acquire.assert_not_called()
+
+
 async def test_update_multiple_primary_key(engine):
     u1 = await test_create(engine)
     u2 = await test_create(engine)
@@ -287,6 +367,25 @@ async def test_lookup_287(bind):
         await Game.gino.drop()
 
 
+async def test_lookup_attr_factory():
+    class IntAttribute(ColumnAttribute):
+        def __get__(self, instance, owner):
+            rv = super().__get__(instance, owner)
+            if instance is not None and rv is not None:
+                rv = int(rv)
+            return rv
+
+    class ModelWithAttrFactory(db.Model):
+        __tablename__ = "gino_test_attr_factory"
+        __attr_factory__ = IntAttribute
+
+        id = db.Column(db.Integer(), primary_key=True)
+
+    m = ModelWithAttrFactory(id="42")
+    assert m.lookup().right.value == 42
+    assert m._pk_params() == {"_pk_0": 42}
+
+
 async def test_lookup_custom_name(bind):
     class ModelWithCustomColumnNames(db.Model):
         __tablename__ = "gino_test_custom_column_names"
@@ -329,3 +428,47 @@ async def test_lookup_custom_name(bind):
         ) == {(1,)}
     finally:
         await ModelWithCustomColumnNames.gino.drop()
+
+
+async def test_compiled_cache(engine, mocker):
+    u = await User.create(bind=engine, nickname="cached")
+    await User.get(u.id, bind=engine)
+    await u.update(nickname="cached").apply(bind=engine)
+    await (await User.create(bind=engine, nickname="warm")).delete(bind=engine)
+
+    compiled = []
+    compile_ = ClauseElement.compile
+
+    def compile_spy(elem, *args, **kwargs):
+        compiled.append(elem)
+        return compile_(elem, *args, **kwargs)
+
+    mocker.patch.object(ClauseElement, "compile", compile_spy)
+    for i in range(3):
+        u2 = await User.create(bind=engine, nickname="cached_{}".format(i))
+        assert (await User.get(u2.id, bind=engine)).nickname == u2.nickname
+        await u2.update(nickname="updated_{}".format(i)).apply(bind=engine)
+        assert (await User.get(u2.id, bind=engine)).nickname == u2.nickname
+        assert (await u2.delete(bind=engine)) == "DELETE 1"
+    assert not compiled
+
+    # queries with customized execution options are not cached
+    await User.get(u.id, bind=engine, timeout=10)
+    assert len(compiled) == 1
+
+
+async def test_compiled_cache_released_with_engine(engine):
+    dialects = []
+    for i in range(3):
+        e = await gino.create_engine(PG_URL, min_size=1)
+        # runs the has_table() and has_type() checks
+        await db.gino.create_all(bind=e)
+        u = await User.create(bind=e, nickname="released_{}".format(i))
+        await User.get(u.id, bind=e)
+        await u.update(nickname="updated").apply(bind=e)
+        await u.delete(bind=e)
+        await e.close()
+        dialects.append(weakref.ref(e.dialect))
+    del e
+    gc.collect()
+    assert [ref() for ref in dialects] == [None] * 3
@@ -1,10 +1,12 @@
 import asyncio
+import gc
 import logging
 from datetime import datetime
 
 import asyncpg
 from asyncpg.exceptions import InvalidCatalogNameError
 from gino import create_engine, UninitializedError
+from gino.dialects.base import ExecutionContextOverride
 import pytest
 from sqlalchemy.exc import ObjectNotExecutableError
 import sqlalchemy as sa
@@ -469,3 +471,40 @@ async def test_repr():
         assert 'cur=10 use=1' in repr(e)
     assert 'cur=10 use=0' in repr(e)
     assert 'asyncpg.pool.Pool' in e.repr(color=True)
+
+
+async def test_no_context_cycles(bind):
+    # execution contexts must be freed by refcounting, without the cyclic GC
+    await User.create(nickname="cycles")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(10):
+            assert await User.query.gino.all()
+            async with db.transaction():
+                async for u in User.query.gino.iterate():
+                    assert u.nickname
+        contexts = [
+            o for o in gc.get_objects() if isinstance(o, ExecutionContextOverride)
+        ]
+        assert not contexts
+    finally:
+        gc.enable()
+
+
+async def test_acquire_without_lock(engine, mocker):
+    # the lock only guards the lazy checkout, not the statements after it
+    async with engine.acquire() as conn:
+        # noinspection PyProtectedMember
+        lock = mocker.spy(conn._dbapi_conn._lock, "acquire")
+        assert await conn.scalar("select 1") == 1
+        async with engine.acquire(reuse=True) as conn2:
+            assert await conn2.scalar("select 2") == 2
+        assert lock.call_count == 0
+
+    async with engine.acquire(lazy=True) as conn:
+        # noinspection PyProtectedMember
+        lock = mocker.spy(conn._dbapi_conn._lock, "acquire")
+        assert await conn.scalar("select 1") == 1
+        assert await conn.scalar("select 2") == 2
+        assert lock.call_count == 1
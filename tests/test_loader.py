@@ -3,6 +3,7 @@ from datetime import datetime
 
 import pytest
 
+from gino import MultipleResultsFound
 from gino.loader import AliasLoader
 from sqlalchemy import select
 from sqlalchemy.sql.functions import count
@@ -61,6 +62,27 @@ async def test_one_or_none(user):
     assert user.nickname == name
 
 
+async def test_one_or_none_multiple(user):
+    await User.create(nickname="1", team_id=user.team.id)
+    await User.create(nickname="2", team_id=user.team.id)
+    with pytest.raises(MultipleResultsFound):
+        await User.query.gino.one_or_none()
+    with pytest.raises(MultipleResultsFound):
+        await User.query.gino.load(User.nickname).one_or_none()
+
+
+async def test_one_or_none_distinct(user):
+    # three rows are loaded into one distinct object, none of them is skipped
+    await User.create(nickname="1", team_id=user.team.id)
+    await User.create(nickname="2", team_id=user.team.id)
+    query = User.outerjoin(Team).select().where(Team.id == user.team.id)
+    team = await query.gino.load(
+        Team.distinct(Team.id).load(add_member=User)
+    ).one_or_none()
+    assert team.id == user.team.id
+    assert len(team.members) == 3
+
+
 async def test_one(user):
     name = await User.query.gino.load(User.nickname).one()
     assert user.nickname == name